@@ -9,7 +9,7 @@
 # Build the files to DocString reference
 # sphinx-apidoc -o docs/development/foundations/code_structure src
 # Build html
-# sphinx-build -b html -v docs docs/_build/html
+# sphinx-build -b html -j auto -v docs docs/_build/html
 # start docs/_build/html/index.html
 
 
@@ -3,11 +3,16 @@ import json
 import os
 import yaml
 
+# Use the libyaml-backed emitter when available, it is considerably faster than the pure-Python one.
+Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 def json2yml(root, file):
     dir = root + "/" + file
     print(dir)
-    yml = yaml.dump(json.load(open(dir)), default_flow_style=False, sort_keys=False)
+    yml = yaml.dump(
+        json.load(open(dir)), Dumper=Dumper, default_flow_style=False, sort_keys=False
+    )
     yml_dir = dir.split(".")[0] + "_yml.yml"
     with open(yml_dir, "w") as yaml_file:
         yaml_file.write(yml)
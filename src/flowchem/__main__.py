@@ -15,6 +15,13 @@ from loguru import logger
 from flowchem import __version__
 from flowchem.server.core import Flowchem
 
+try:
+    import uvloop
+
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
+
 
 @click.argument("device_config_file", type=click.Path(), required=True)
 @click.option(
@@ -77,6 +84,14 @@ def main(device_config_file, logfile, host, debug):
         )
         await server.serve()
 
+    # uvloop (optional, not available on Windows) is a faster drop-in replacement for the asyncio event loop.
+    if HAS_UVLOOP:
+        logger.debug("Using uvloop event loop")
+        if hasattr(uvloop, "run"):
+            uvloop.run(main_loop())
+            return
+        # uvloop < 0.18 has no run(): install its event loop policy for asyncio.run() instead
+        uvloop.install()
     asyncio.run(main_loop())
 
 
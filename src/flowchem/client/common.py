@@ -52,7 +52,7 @@ class FlowchemCommonDeviceListener(ServiceListener):
             self.active_ips = []
             for socket in respond_sockets:
                 self.active_ips.append(socket.getsockname()[0])
-            print(self.active_ips)
+            logger.debug(f"Listening for flowchem devices on {self.active_ips}")
         else:
             self.active_ips = []
 
@@ -216,19 +216,13 @@ class Valve(FlowchemComponent):
                         _connections_per_position[rotor_position] = (stator_position,)
                         # get rid of the keys, values are the connected ports in each position
             connections[_] = tuple(_connections_per_position.values())
-        # lastly, trim the lists of connections that already exist
-        # trim returned connections
-        unique_connections = set(connections.values())
-        to_delete = []
-        for connection in unique_connections:
-            counter = 0
-            for key, value in connections.items():
-                if connection == value:
-                    if counter > 0:
-                        to_delete.append(key)
-                    counter += 1
-        for _ in to_delete:
-            del connections[_]
+        # lastly, trim the lists of connections that already exist: keep only the first position yielding them
+        seen: set[ValveConnections] = set()
+        for key, value in list(connections.items()):
+            if value in seen:
+                del connections[key]
+            else:
+                seen.add(value)
 
         return connections
 
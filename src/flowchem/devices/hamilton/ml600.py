@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 from collections.abc import Mapping
 import string
 import warnings
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import Enum
 
 import aioserial
@@ -88,12 +89,58 @@ class ML600Commands(Enum):
     EMPTY = ""
 
 
-# i.e. PUMP_ADDRESS = {1: 'a', 2: 'b', 3: 'c', 4: 'd', ..., 16: 'p'}
+# i.e. PUMP_ADDRESS = ('', 'a', 'b', 'c', 'd', ..., 'p'), indexed by pump number (1-16).
 # Note ':' is used for broadcast within the daisy chain.
-PUMP_ADDRESS = dict(enumerate(string.ascii_lowercase[:16], start=1))
+PUMP_ADDRESS = ("", *string.ascii_lowercase[:16])
+
+
+@functools.lru_cache(maxsize=512)
+def _compile_command(
+    target_pump_num: int,
+    target_component: str,
+    command: ML600Commands,
+    command_value: str,
+    optional_parameter: str,
+    parameter_value: str,
+    execution_command: str,
+) -> str:
+    """Build the command string. Cached as the same few commands are sent over and over (e.g. idle polling)."""
+    compiled_command = (
+        f"{PUMP_ADDRESS[target_pump_num]}"
+        f"{target_component}"
+        f"{command.value}{command_value}"
+    )
+    if parameter_value:
+        compiled_command += f"{optional_parameter}{parameter_value}"
+    return compiled_command + execution_command
+
+
+# Unit conversions with pint are slow, and the same few rates/volumes are requested over and over.
+# The caches are keyed on (magnitude, unit) pairs, as hashing a pint.Quantity converts it to base units.
+@functools.lru_cache(maxsize=256)
+def _seconds_per_stroke(
+    flowrate: float,
+    flowrate_unit: pint.Unit,
+    steps_per_ml: float,
+    steps_unit: pint.Unit,
+) -> pint.Quantity:
+    """Convert flow rate to seconds per stroke."""
+    flowrate_in_steps_sec = ureg.Quantity(flowrate, flowrate_unit) * ureg.Quantity(
+        steps_per_ml, steps_unit
+    )
+    return (1 / flowrate_in_steps_sec).to("second/stroke")
+
 
+@functools.lru_cache(maxsize=256)
+def _step_position(
+    volume: float, volume_unit: pint.Unit, steps_per_ml: float, steps_unit: pint.Unit
+) -> int:
+    """Convert a volume to a step position."""
+    steps = ureg.Quantity(volume, volume_unit) * ureg.Quantity(steps_per_ml, steps_unit)
+    return round(steps.m_as("steps"))
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class Protocol1Command:
     """Class representing a pump command and its expected reply."""
 
@@ -107,14 +154,15 @@ class Protocol1Command:
 
     def compile(self) -> str:
         """Create actual command byte by prepending pump address to command and appending executing command."""
-        compiled_command = (
-            f"{PUMP_ADDRESS[self.target_pump_num]}"
-            f"{self.target_component}"
-            f"{self.command.value}{self.command_value}"
+        return _compile_command(
+            self.target_pump_num,
+            self.target_component,
+            self.command,
+            self.command_value,
+            self.optional_parameter,
+            self.parameter_value,
+            self.execution_command,
         )
-        if self.parameter_value:
-            compiled_command += f"{self.optional_parameter}{self.parameter_value}"
-        return compiled_command + self.execution_command
 
     def multiple_compile(self, command_string: str | None) -> str:
         """Create actual command byte by prepending pump address and appending execute command."""
@@ -132,10 +180,8 @@ class Protocol1Command:
 
     def _multiple_compile(self) -> str:
         """Create command string for an individual pump component."""
-        if not self.command_value:
-            self.command_value = ""
         compiled_command = (
-            f"{self.target_component}{self.command.value}{self.command_value}"
+            f"{self.target_component}{self.command.value}{self.command_value or ''}"
         )
         if self.parameter_value:
             compiled_command += f"{self.optional_parameter}{self.parameter_value}"
@@ -153,6 +199,12 @@ class HamiltonPumpIO:
         "parity": aioserial.PARITY_ODD,
         "stopbits": aioserial.STOPBITS_ONE,
         "bytesize": aioserial.SEVENBITS,
+        # Never block forever on a stalled port; no flow control and no DTR toggling (which may reset the adapter).
+        "write_timeout": 1,
+        "inter_byte_timeout": None,
+        "xonxoff": False,
+        "rtscts": False,
+        "dsrdtr": False,
     }
 
     def __init__(self, aio_port: aioserial.Serial) -> None:
@@ -192,6 +244,8 @@ class HamiltonPumpIO:
             # The command for an unknown reason often replies wrongly on first attempt, so done twice.
             await self._write_async(b"1a\r")
             await self._read_reply_async()
+            # Drop whatever is left of the (possibly wrong) first reply
+            self._serial.reset_input_buffer()
             await self._write_async(b"1a\r")
         except aioserial.SerialException as e:
             raise InvalidConfigurationError from e
@@ -200,17 +254,39 @@ class HamiltonPumpIO:
         if not reply or reply[:1] != "1":
             raise InvalidConfigurationError(f"No pump found on {self._serial.port}")
         # reply[1:2] should be the address of the last pump. However, this does not work reliably.
-        # So here we enumerate the pumps explicitly instead.
-        last_pump = 0
-        for pump_num, address in PUMP_ADDRESS.items():
-            await self._write_async(f"{address}UR\r".encode("ascii"))
-            if "NV01" in await self._read_reply_async():
-                last_pump = pump_num
-            else:
-                break
+        # So it is only used as a hint, confirmed by probing that address and the next one.
+        last_pump = await self._check_last_pump_hint(reply[1:2])
+        if last_pump is not None:
+            logger.debug(f"Last pump address hint '{reply[1:2]}' confirmed")
+        else:
+            # Enumerate the pumps explicitly instead.
+            logger.debug(f"Invalid last pump address hint {reply[1:2]!r}, enumerating")
+            last_pump = 0
+            for pump_num, address in enumerate(PUMP_ADDRESS[1:], start=1):
+                if await self._pump_replies(address):
+                    last_pump = pump_num
+                else:
+                    break
         logger.debug(f"Found {last_pump} pumps on {self._serial.port}!")
         return int(last_pump)
 
+    async def _check_last_pump_hint(self, hint: str) -> int | None:
+        """Return the pump number matching the address hint if confirmed by the hardware, None otherwise."""
+        if hint not in PUMP_ADDRESS[1:] or not await self._pump_replies(hint):
+            return None
+        pump_num = PUMP_ADDRESS.index(hint)
+        # The hint is only valid if it is the last pump in the chain
+        if pump_num < len(PUMP_ADDRESS) - 1 and await self._pump_replies(
+            PUMP_ADDRESS[pump_num + 1]
+        ):
+            return None
+        return pump_num
+
+    async def _pump_replies(self, address: str) -> bool:
+        """Check if a pump with the given address is present by requesting its firmware version."""
+        self._serial.reset_input_buffer()
+        return "NV01" in await self._xact(f"{address}UR\r".encode("ascii"))
+
     async def all_hw_init(self):
         """Send to all pumps the HW initialization command (i.e. homing)."""
         await self._write_async(b":K\r")
@@ -220,13 +296,21 @@ class HamiltonPumpIO:
         # Note: no need to consume reply here because there is none (broadcast).
 
     async def _write_async(self, command: bytes):
-        """Write a command to the pump."""
-        await self._serial.write_async(command)
+        """Write a command to the pump, retrying once on write timeout."""
+        try:
+            await self._serial.write_async(command)
+        except aioserial.SerialTimeoutException:
+            logger.warning(f"Timeout writing {command!r}, retrying once")
+            self._serial.reset_output_buffer()
+            await self._serial.write_async(command)
         logger.debug(f"Command {command!r} sent!")
 
     async def _read_reply_async(self) -> str:
-        """Read the pump reply from serial communication."""
-        reply_string = await self._serial.readline_async()
+        """Read the pump reply from serial communication.
+
+        Replies are terminated by <cr>, so read until that instead of waiting for a <lf> that never comes (timeout).
+        """
+        reply_string = await self._serial.read_until_async(b"\r")
         logger.debug(f"Reply received: {reply_string}")
         return reply_string.decode("ascii")
 
@@ -247,28 +331,43 @@ class HamiltonPumpIO:
         """Convert an ASCII reply string to its binary representation."""
         return "".join(format(byte, "08b") for byte in reply.encode("ascii"))[::-1]
 
-    async def write_and_read_reply_async(
-        self, command: Protocol1Command, retries: int = 3, retry_delay: float = 0.2
+    async def _xact(self, command: bytes) -> str:
+        """Write a command and read its reply in one go (the caller is responsible for locking)."""
+        await self._write_async(command)
+        return await self._read_reply_async()
+
+    async def _xact_with_retries(
+        self, command: bytes, target_pump_num: int, retries: int, retry_delay: float
     ) -> str:
-        """Send a command to the pump, read the reply and return it parsed."""
+        """Send a compiled command under the serial lock, retrying on empty replies, and return the parsed reply."""
         async with self._serial_lock:
             for attempt in range(1, retries + 1):
                 self._serial.reset_input_buffer()
-                await self._write_async(f"{command.compile()}\r".encode("ascii"))
-                response = await self._read_reply_async()
+                response = await self._xact(command)
                 if response:
                     return self._parse_response(response)
                 logger.warning(
                     f"No response from pump (attempt {attempt}/{retries}). "
-                    f"Pump address: {command.target_pump_num}"
+                    f"Pump address: {target_pump_num}"
                 )
                 if attempt < retries:
                     await asyncio.sleep(retry_delay)
             raise DeviceError(
                 f"No response received from pump after {retries} attempts! "
-                f"Maybe wrong pump address? (Set to {command.target_pump_num})"
+                f"Maybe wrong pump address? (Set to {target_pump_num})"
             )
 
+    async def write_and_read_reply_async(
+        self, command: Protocol1Command, retries: int = 3, retry_delay: float = 0.2
+    ) -> str:
+        """Send a command to the pump, read the reply and return it parsed."""
+        return await self._xact_with_retries(
+            f"{command.compile()}\r".encode("ascii"),
+            command.target_pump_num,
+            retries,
+            retry_delay,
+        )
+
     async def multiple_write_and_read_reply_async(
         self,
         command: list[Protocol1Command] | Protocol1Command,
@@ -276,29 +375,14 @@ class HamiltonPumpIO:
         retry_delay: float = 0.2,
     ) -> str:
         """Send one or more commands to the pump, read the reply and return it parsed."""
-        async with self._serial_lock:
-            if not isinstance(command, list):
-                command = [command]
-            command_compiled = ""
-            for com in command:
-                command_compiled += com._multiple_compile()
-            com_comp = com.multiple_compile(command_compiled)
-            for attempt in range(1, retries + 1):
-                self._serial.reset_input_buffer()
-                await self._write_async(com_comp.encode("ascii"))
-                response = await self._read_reply_async()
-                if response:
-                    return self._parse_response(response)
-                logger.warning(
-                    f"No response from pump (attempt {attempt}/{retries}). "
-                    f"Pump address: {command[0].target_pump_num}"
-                )
-                if attempt < retries:
-                    await asyncio.sleep(retry_delay)
-            raise DeviceError(
-                f"No response received from pump after {retries} attempts! "
-                f"Maybe wrong pump address? (Set to {command[0].target_pump_num})"
-            )
+        if not isinstance(command, list):
+            command = [command]
+        compiled = command[0].multiple_compile(
+            "".join(com._multiple_compile() for com in command)
+        )
+        return await self._xact_with_retries(
+            compiled.encode("ascii"), command[0].target_pump_num, retries, retry_delay
+        )
 
 
 class ValveType(Enum):
@@ -383,6 +467,9 @@ class ML600(FlowchemDevice):
         )
         self.inspect_valve_argument(config)
         self.dual_syringe = False
+        # Syringe configuration and firmware are fixed in hardware: probed once, then cached.
+        self._is_single_syringe: bool | None = None
+        self._firmware_version: str | None = None
 
     def inspect_valve_argument(self, config: dict):
         if config.get("left_valve") and config.get("left_valve") not in ValveType:
@@ -482,8 +569,9 @@ class ML600(FlowchemDevice):
 
     async def send_command_and_read_reply(self, command: Protocol1Command) -> str:
         """Send a command to the pump. Here we just add the right pump number."""
-        command.target_pump_num = self.address
-        return await self.pump_io.write_and_read_reply_async(command)
+        return await self.pump_io.write_and_read_reply_async(
+            replace(command, target_pump_num=self.address)
+        )
 
     def _validate_speed(self, speed: pint.Quantity | None) -> str:
         """Validate speed (seconds/stroke) and return it as a string for use in a command.
@@ -528,8 +616,12 @@ class ML600(FlowchemDevice):
 
     def _flowrate_to_seconds_per_stroke(self, flowrate: pint.Quantity) -> pint.Quantity:
         """Convert flow rate to seconds per stroke."""
-        flowrate_in_steps_sec = flowrate * self._steps_per_ml
-        return (1 / flowrate_in_steps_sec).to("second/stroke")
+        return _seconds_per_stroke(
+            flowrate.magnitude,
+            flowrate.units,
+            self._steps_per_ml.magnitude,
+            self._steps_per_ml.units,
+        )
 
     def _seconds_per_stroke_to_flowrate(
         self, second_per_stroke: pint.Quantity
@@ -540,8 +632,12 @@ class ML600(FlowchemDevice):
 
     def _volume_to_step_position(self, volume: pint.Quantity) -> int:
         """Convert a volume to a step position."""
-        steps = volume * self._steps_per_ml
-        return round(steps.m_as("steps"))
+        return _step_position(
+            volume.magnitude,
+            volume.units,
+            self._steps_per_ml.magnitude,
+            self._steps_per_ml.units,
+        )
 
     async def get_current_volume(self, pump: str = "") -> pint.Quantity:
         """Return current syringe position in ml."""
@@ -683,8 +779,11 @@ class ML600(FlowchemDevice):
     async def wait_until_idle(self, pump: str = "") -> bool:
         """Return when no more commands are present in the pump buffer."""
         logger.debug(f"ML600 {self.name} wait until idle...")
+        # Poll quickly at first (short moves end fast), then back off not to flood the serial line on long moves.
+        delay = 0.01
         while not await self.is_idle(pump=pump):
-            await asyncio.sleep(0.1)
+            await asyncio.sleep(delay)
+            delay = min(delay * 1.5, 0.2)
         logger.debug(f"...ML600 {self.name} idle now!")
         return True
 
@@ -703,25 +802,31 @@ class ML600(FlowchemDevice):
 
     async def is_single_syringe(self) -> bool:
         """Determine if single or dual syringe."""
+        if self._is_single_syringe is not None:
+            return self._is_single_syringe
+
         is_single = await self.send_command_and_read_reply(
             Protocol1Command(
                 command=ML600Commands.IS_SINGLE_SYRINGE, execution_command=""
             ),
         )
         if is_single == "N":
-            return False
+            self._is_single_syringe = False
         elif is_single == "Y":
-            return True
+            self._is_single_syringe = True
         else:
             raise InvalidConfigurationError(
                 "Neither single nor dual syringe — something is wrong."
             )
+        return self._is_single_syringe
 
     async def version(self) -> str:
         """Return the current firmware version reported by the pump."""
-        return await self.send_command_and_read_reply(
-            Protocol1Command(command=ML600Commands.FIRMWARE_VERSION)
-        )
+        if self._firmware_version is None:
+            self._firmware_version = await self.send_command_and_read_reply(
+                Protocol1Command(command=ML600Commands.FIRMWARE_VERSION)
+            )
+        return self._firmware_version
 
     async def get_valve_angle(self, valve_code: str = "") -> int:
         """Return the current valve angle (0-359 degrees)."""
@@ -823,7 +928,9 @@ class ML600(FlowchemDevice):
         self, list_of_commands: list[Protocol1Command]
     ) -> str:
         """Send multiple commands to the pump in one serial transaction."""
-        return await self.pump_io.multiple_write_and_read_reply_async(list_of_commands)
+        return await self.pump_io.multiple_write_and_read_reply_async(
+            [replace(com, target_pump_num=self.address) for com in list_of_commands]
+        )
 
     async def set_to_volume_dual_syringes(
         self,
@@ -1,6 +1,7 @@
 """This module is used to discover the serial address of any Elite11 connected to the PC."""
 
 import asyncio
+import itertools
 from textwrap import dedent
 
 from loguru import logger
@@ -8,14 +9,14 @@ from loguru import logger
 from flowchem.devices.harvardapparatus.elite11 import Elite11, HarvardApparatusPumpIO
 from flowchem.utils.exceptions import InvalidConfigurationError
 
+# Static counter for device type across different serial ports
+_elite11_counter = itertools.count(1)
+
 
 # noinspection PyProtectedMember
 def elite11_finder(serial_port) -> set[str]:
     """Try to initialize an Elite11 on every available COM port. [Does not support daisy-chained Elite11!]."""
     logger.debug(f"Looking for Elite11 pumps on {serial_port}...")
-    # Static counter for device type across different serial ports
-    if "counter" not in elite11_finder.__dict__:
-        elite11_finder.counter = 0  # type: ignore
     cfg: set[str] = set()
 
     try:
@@ -50,9 +51,7 @@ def elite11_finder(serial_port) -> set[str]:
 
     logger.info(f"Elite11 found on <{serial_port}>")
 
-    # Local variable for enumeration
-    elite11_finder.counter += 1  # type: ignore
-    msg = f"[device.elite11-{elite11_finder.counter}]"  # type: ignore
+    msg = f"[device.elite11-{next(_elite11_counter)}]"
     msg += dedent(
         f"""
                    type = "Elite11"
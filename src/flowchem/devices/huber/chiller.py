@@ -36,6 +36,8 @@ class HuberChiller(FlowchemDevice):
     ) -> None:
         super().__init__(name)
         self._serial = aio
+        # Lock communication between write and read reply
+        self._lock = asyncio.Lock()
         self._min_t: float = min_temp
         self._max_t: float = max_temp
 
@@ -109,17 +111,23 @@ class HuberChiller(FlowchemDevice):
         -------
             str: reply received
         """
-        # Send command. Using PBCommand ensure command validation, see PBCommand.to_chiller()
-        pb_command = PBCommand(command.upper())
-        await self._serial.write_async(pb_command.to_chiller())
-        logger.debug(f"Command {command[0:8]} sent!")
-
-        # Receive reply and return it after decoding
-        try:
-            reply = await asyncio.wait_for(self._serial.readline_async(), 3)
-        except asyncio.TimeoutError:
-            logger.error("No reply received! Unsupported command?")
-            return ""
+        # Using PBCommand ensure command validation, see PBCommand.to_chiller()
+        pb_command = PBCommand(command.upper()).to_chiller()
+
+        # Concurrent callers (e.g. multiple API requests) must not interleave their write and read on the serial line.
+        async with self._lock:
+            # Drop late bytes of a previous (timed out or short) reply, so they are not read as this reply
+            self._serial.reset_input_buffer()
+            await self._serial.write_async(pb_command)
+            logger.debug(f"Command {command[0:8]} sent!")
+
+            # Receive reply and return it after decoding.
+            # PB replies have a fixed length ("{S" + address + 4-char value + "\r\n"), so read it in one go.
+            try:
+                reply = await asyncio.wait_for(self._serial.read_async(10), 3)
+            except asyncio.TimeoutError:
+                logger.error("No reply received! Unsupported command?")
+                return ""
 
         logger.debug(f"Reply received: {reply}")
         return reply.decode("ascii")
@@ -179,11 +187,11 @@ class HuberChiller(FlowchemDevice):
     @staticmethod
     def _temp_to_string(temp: pint.Quantity) -> str:
         """From temperature to string for command. f^-1 of PCommand.parse_temperature."""
-        assert (
-            ureg.Quantity("-151 °C") <= temp <= ureg.Quantity("327 °C")
-        ), "Protocol temperature limits"
+        # Convert once and compare plain floats, parsing pint quantities on every call is slow.
+        celsius = temp.m_as("°C")
+        assert -151 <= celsius <= 327, "Protocol temperature limits"
         # Hexadecimal two's complement
-        return f"{int(temp.m_as('°C') * 100) & 65535:04X}"
+        return f"{int(celsius * 100) & 65535:04X}"
 
     @staticmethod
     def _int_to_string(number: int) -> str:
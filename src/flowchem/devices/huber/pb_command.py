@@ -1,8 +1,59 @@
+import functools
 from dataclasses import dataclass
 
 from flowchem import ureg
 
 
+@functools.lru_cache(maxsize=256)
+def _validated_command(command: str) -> str:
+    """Check command structure to be compliant with PB format and return it with EOL.
+
+    Cached, as most commands are constant queries (e.g. "{M01****") sent over and over.
+    """
+    if len(command) == 8:
+        command += "\r\n"
+    # 10 characters
+    assert len(command) == 10
+    # Starts with {
+    assert command[0] == "{"
+    # M for master (commands) S for slave (replies).
+    assert command[1] in ("M", "S")
+    # Address, i.e. the desired function. Hex encoded.
+    assert 0 <= int(command[2:4], 16) < 256
+    # Value
+    assert command[4:8] == "****" or 0 <= int(command[4:8], 16) <= 65536
+    # EOL
+    assert command[8:10] == "\r\n"
+    return command
+
+
+# Flags in the status replies and their bit mask, in the order listed in the manual (from most significant bit).
+_STATUS1_MASKS = (
+    ("temp_ctl_is_process", 1 << 15),
+    ("circulation_active", 1 << 14),
+    ("refrigerator_on", 1 << 13),
+    ("temp_is_process", 1 << 12),
+    ("circulating_pump", 1 << 11),
+    ("cooling_power_available", 1 << 10),
+    ("tkeylock", 1 << 9),
+    ("is_pid_auto", 1 << 8),
+    ("error", 1 << 7),
+    ("warning", 1 << 6),
+    ("int_temp_mode", 1 << 5),
+    ("ext_temp_mode", 1 << 4),
+    ("dv_e_grade", 1 << 3),
+    ("power_failure", 1 << 2),
+    ("freeze_protection", 1 << 1),
+)
+_STATUS2_MASKS = (
+    ("controller_is_external", 1 << 15),
+    ("drip_tray_full", 1 << 10),
+    ("venting_active", 1 << 8),
+    ("venting_successful", 1 << 7),
+    ("venting_monitored", 1 << 6),
+)
+
+
 @dataclass
 class PBCommand:
     """Class representing a PBCommand."""
@@ -16,20 +67,7 @@ class PBCommand:
 
     def validate(self):
         """Check command structure to be compliant with PB format."""
-        if len(self.command) == 8:
-            self.command += "\r\n"
-        # 10 characters
-        assert len(self.command) == 10
-        # Starts with {
-        assert self.command[0] == "{"
-        # M for master (commands) S for slave (replies).
-        assert self.command[1] in ("M", "S")
-        # Address, i.e. the desired function. Hex encoded.
-        assert 0 <= int(self.command[2:4], 16) < 256
-        # Value
-        assert self.command[4:8] == "****" or 0 <= int(self.command[4:8], 16) <= 65536
-        # EOL
-        assert self.command[8:10] == "\r\n"
+        self.command = _validated_command(self.command)
 
     @property
     def data(self) -> str:
@@ -39,13 +77,9 @@ class PBCommand:
     def parse_temperature(self) -> float:
         """Parse a device temp from hex string to Celsius float."""
         # self.data is the two's complement 16-bit signed hex, see manual
-        temp = (
-            (int(self.data, 16) - 65536) / 100
-            if int(self.data, 16) > 32767
-            else (int(self.data, 16)) / 100
-        )
+        value = int(self.data, 16)
         # Note: -151 used for invalid temperatures!
-        return temp
+        return (value - 65536) / 100 if value > 32767 else value / 100
 
     def parse_integer(self) -> int:
         """Parse a device reply from hexadecimal string to base 10 integers."""
@@ -57,8 +91,9 @@ class PBCommand:
 
     def parse_bits(self) -> list[bool]:
         """Parse a device reply from hexadecimal string to 16 constituting bits."""
-        bits = f"{int(self.data, 16):016b}"
-        return [bool(int(x)) for x in bits]
+        value = int(self.data, 16)
+        # Most significant bit first, i.e. bits[0] is bit 15
+        return [bool(value & 1 << bit) for bit in range(15, -1, -1)]
 
     def parse_boolean(self):
         """Parse a device reply from hexadecimal string (0x0000 or 0x0001) to boolean."""
@@ -66,32 +101,10 @@ class PBCommand:
 
     def parse_status1(self) -> dict[str, bool]:
         """Parse response to status1 command and returns dict."""
-        bits = self.parse_bits()
-        return {
-            "temp_ctl_is_process": bits[0],
-            "circulation_active": bits[1],
-            "refrigerator_on": bits[2],
-            "temp_is_process": bits[3],
-            "circulating_pump": bits[4],
-            "cooling_power_available": bits[5],
-            "tkeylock": bits[6],
-            "is_pid_auto": bits[7],
-            "error": bits[8],
-            "warning": bits[9],
-            "int_temp_mode": bits[10],
-            "ext_temp_mode": bits[11],
-            "dv_e_grade": bits[12],
-            "power_failure": bits[13],
-            "freeze_protection": bits[14],
-        }
+        value = self.parse_integer()
+        return {name: bool(value & mask) for name, mask in _STATUS1_MASKS}
 
     def parse_status2(self) -> dict[str, bool]:
         """Parse response to status2 command and returns dict. See manufacturer docs for more info."""
-        bits = self.parse_bits()
-        return {
-            "controller_is_external": bits[0],
-            "drip_tray_full": bits[5],
-            "venting_active": bits[7],
-            "venting_successful": bits[8],
-            "venting_monitored": bits[9],
-        }
+        value = self.parse_integer()
+        return {name: bool(value & mask) for name, mask in _STATUS2_MASKS}
@@ -14,7 +14,6 @@ class KnauerEthernetDevice:
 
     TCP_PORT = 10001
     BUFFER_SIZE = 1024
-    _id_counter = 0
 
     def __init__(self, ip_address, mac_address, network="", **kwargs):
         """Knauer Ethernet Device - either pump or valve.
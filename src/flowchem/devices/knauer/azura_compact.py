@@ -154,16 +154,18 @@ class AzuraCompact(KnauerEthernetDevice, FlowchemDevice):
         if not reply.startswith("ERROR") or reply.startswith("ERRORS:"):
             return False
 
-        if "ERROR:1" in reply:
-            warnings.warn("Invalid message sent to device.\n", stacklevel=2)
-
-        elif "ERROR:2" in reply:
-            warnings.warn(
-                "Setpoint refused by device.\n" "Refer to manual for allowed values.\n",
-                stacklevel=2,
-            )
-        else:
-            warnings.warn("Unspecified error detected!")
+        # Error code is the character after "ERROR:"
+        match reply[6:7]:
+            case "1":
+                warnings.warn("Invalid message sent to device.\n", stacklevel=2)
+            case "2":
+                warnings.warn(
+                    "Setpoint refused by device.\n"
+                    "Refer to manual for allowed values.\n",
+                    stacklevel=2,
+                )
+            case _:
+                warnings.warn("Unspecified error detected!")
         return True
 
     async def _transmit_and_parse_reply(self, message: str) -> str:
@@ -247,7 +249,10 @@ class AzuraCompact(KnauerEthernetDevice, FlowchemDevice):
             self.max_allowed_pressure, self.max_allowed_flow = 150, 50000
 
     async def get_headtype(self) -> AzuraPumpHeads:
-        """Return pump's head type."""
+        """Return pump's head type. Queried once, then served from cache (see `set_headtype()`)."""
+        if self._headtype is not None:
+            return self._headtype
+
         head_type_id = await self.create_and_send_command(HEADTYPE)
         try:
             headtype = AzuraPumpHeads(int(head_type_id))
@@ -264,7 +269,11 @@ class AzuraCompact(KnauerEthernetDevice, FlowchemDevice):
 
     async def set_headtype(self, head_type: AzuraPumpHeads):
         """Set pump's head type."""
-        await self.create_and_send_command(HEADTYPE, setpoint=head_type.value)
+        reply = await self.create_and_send_command(HEADTYPE, setpoint=head_type.value)
+        if reply != "OK":
+            # The pump still has the previous head, keep its commands and limits
+            logger.warning(f"Head type {head_type} refused, still {self._headtype}")
+            return
         # Update internal property (changes max flowrate etc.)
         self._headtype = head_type
         logger.debug(f"Head type set to {head_type}")
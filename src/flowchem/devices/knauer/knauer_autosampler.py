@@ -39,6 +39,7 @@ import asyncio
 from typing import Type
 
 import functools
+import struct
 import time
 import pint
 from flowchem import ureg
@@ -129,22 +130,115 @@ class CommandModus(Enum):
     GET_ACTUAL = auto()
 
 
-def send_until_acknowledged(max_reaction_time=15):
+@functools.cache
+def _communication_flag_values() -> frozenset[bytes]:
+    """Byte values of the CommunicationFlags that form a complete reply on their own (e.g. ACK).
+
+    MESSAGE_START is excluded: on its own it is only the first chunk of a framed reply.
+    """
+    return frozenset(
+        flag.value
+        for flag in CommunicationFlags  # type: ignore
+        if flag is not CommunicationFlags.MESSAGE_START  # type: ignore
+    )
+
+
+@functools.cache
+def _setting_reply_errors() -> dict[bytes, type[ASError] | None]:
+    """Map each flag a setting command can be answered with to the error it raises (None if acknowledged)."""
+    return {
+        CommunicationFlags.ACKNOWLEDGE.value: None,  # type: ignore
+        CommunicationFlags.TRY_AGAIN.value: ASBusyError,  # type: ignore
+        CommunicationFlags.NOT_ACKNOWLEDGE.value: CommandOrValueError,  # type: ignore
+    }
+
+
+@functools.cache
+def _status_names() -> dict[int, str]:
+    """ASStatus names keyed by their numeric status code, as returned by a status query."""
+    return {int(status.value): status.name for status in ASStatus}  # type: ignore
+
+
+@functools.cache
+def _reply_offsets() -> tuple[int, int, int, int, int, int]:
+    """Slice offsets of a query reply frame: STX, ETX, ID, AI, PFC and value ends."""
+    return (
+        ReplyStructure.STX_END.value,  # type: ignore[name-defined]
+        ReplyStructure.ETX_START.value,  # type: ignore[name-defined]
+        ReplyStructure.ID_END.value,  # type: ignore[name-defined]
+        ReplyStructure.AI_END.value,  # type: ignore[name-defined]
+        ReplyStructure.PFC_END.value,  # type: ignore[name-defined]
+        ReplyStructure.VALUE_END.value,  # type: ignore[name-defined]
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _communication_string(
+    command: type["CommandStructure"],  # type: ignore
+    modus: str,
+    autosampler_id: int | None,
+    args: tuple[int | str, ...],
+    kwargs: tuple[tuple[str, str], ...],
+    value_types: tuple[type, ...],
+) -> str:
+    """Build the framed command string (cached by `KnauerAutosampler._construct_communication_string`).
+
+    `value_types` only extends the cache key: 1, 1.0 and True are equal and hash alike, but may format differently.
+    """
+    # input can be strings, is translated to enum internally -> enum no need to expose
+    # if value can't be translated to enum, just throw an error with the available options
+    command_class = command()
+
+    if modus == CommandModus.SET.name:
+        command_class.set_values(*args, **dict(kwargs))
+        communication_string = command_class.return_setting_string()
+
+    elif modus == CommandModus.GET_PROGRAMMED.name:
+        communication_string = command_class.query_programmed()
+
+    elif modus == CommandModus.GET_ACTUAL.name:
+        communication_string = command_class.query_actual()
+
+    else:
+        raise CommandOrValueError(
+            f"You set {modus} as command modus, however modus should be {CommandModus.SET.name},"
+            f" {CommandModus.GET_ACTUAL.name}, {CommandModus.GET_PROGRAMMED.name} "
+        )
+    return f"{CommunicationFlags.MESSAGE_START.value.decode()}{autosampler_id}{ADDITIONAL_INFO}{communication_string}{CommunicationFlags.MESSAGE_END.value.decode()}"  # type: ignore
+
+
+@functools.cache
+def _reply_fields() -> struct.Struct:
+    """Layout of an extended query reply: skip STX, then the ID, AI, PFC and value fields."""
+    stx_end, _, id_end, ai_end, pfc_end, value_end = _reply_offsets()
+    return struct.Struct(
+        f"{stx_end}x{id_end - stx_end}s{ai_end - id_end}s{pfc_end - ai_end}s{value_end - pfc_end}s"
+    )
+
+
+def send_until_acknowledged(max_reaction_time=15, first_delay=0.005, max_delay=0.1):
     def decorator(func):
         @functools.wraps(func)
         async def wrapper(*args, **kwargs):
-            remaining_time = max_reaction_time
-            start_time = time.time()
-            while remaining_time > 0:
+            deadline = time.monotonic() + max_reaction_time
+            delay = first_delay
+            retries = 0
+            while True:
                 try:
                     # Await the decorated async function
-                    result = await func(*args, **kwargs)
-                    return result
+                    return await func(*args, **kwargs)
                 except ASBusyError:
-                    # If the device is busy, wait and retry
-                    elapsed_time = time.time() - start_time
-                    remaining_time = 10 - elapsed_time
-            raise ASError("Maximum reaction time exceeded")
+                    # If the device is busy, back off exponentially and retry until the deadline
+                    remaining_time = deadline - time.monotonic()
+                    if remaining_time <= 0:
+                        break
+                    retries += 1
+                    logger.debug(f"AS busy, retry {retries} of {func.__name__}")
+                    await asyncio.sleep(min(delay, remaining_time))
+                    delay = min(delay * 2, max_delay)
+            raise ASError(
+                f"Maximum reaction time exceeded ({retries} retries while busy)"
+            )
 
         return wrapper
 
@@ -173,6 +267,9 @@ class ASEthernetDevice:
         self.ip_address = str(ip_address)
         self.port = tcp_port if tcp_port else ASEthernetDevice.TCP_PORT
         self.buffersize = buffersize if buffersize else ASEthernetDevice.BUFFER_SIZE
+        # The AS serves one TCP connection at a time: concurrent exchanges would only
+        # get their connect refused and burn CONNECT_RETRY_DELAY, so queue them instead.
+        self._lock = asyncio.Lock()
 
     async def _open_connection_with_retry(self):
         """Open the TCP connection, retrying the transient connect failures the AS
@@ -220,6 +317,11 @@ class ASEthernetDevice:
         The teardown reset (on close) is avoided entirely by not awaiting
         ``wait_closed()``.
         """
+        async with self._lock:
+            return await self._exchange(message, idempotent)
+
+    async def _exchange(self, message: str, idempotent: bool) -> bytes:
+        """Perform the connect/send/receive/close cycle of _send_and_receive (lock held by the caller)."""
         last_exc: Exception | None = None
         for attempt in range(1, ASEthernetDevice.COMMAND_RETRIES + 1):
             writer = None
@@ -233,20 +335,19 @@ class ASEthernetDevice:
                 sent = True
 
                 # Receive the reply in chunks
-                reply = b""
+                reply = bytearray()
                 complete = False
+                flags = _communication_flag_values()
+                message_end = CommunicationFlags.MESSAGE_END.value  # type: ignore
                 while True:
                     chunk = await reader.read(ASEthernetDevice.BUFFER_SIZE)
                     if not chunk:
                         break
                     reply += chunk
-                    try:
-                        CommunicationFlags(chunk)  # type: ignore
-                        complete = True
-                        break
-                    except ValueError:
-                        pass
-                    if CommunicationFlags.MESSAGE_END.value in chunk:  # type: ignore
+                    # Either a bare flag (e.g. ACK) or a frame terminated by MESSAGE_END
+                    if (len(reply) == len(chunk) and chunk in flags) or (
+                        message_end in chunk
+                    ):
                         complete = True
                         break
 
@@ -262,7 +363,7 @@ class ASEthernetDevice:
                         f"AS closed connection with incomplete reply {reply!r}"
                     )
 
-                return reply
+                return bytes(reply)
             except (ConnectionResetError, ConnectionError, OSError) as exc:
                 last_exc = exc
                 # The command was already transmitted and is NOT safe to repeat
@@ -465,6 +566,9 @@ class KnauerAutosampler(FlowchemDevice):
 
         super().__init__(name)
         self.autosampler_id = autosampler_id
+        # ID as echoed (zero-padded) in query replies, compared against the raw reply bytes
+        stx_end, _, id_end, *_ = _reply_offsets()
+        self._id_bytes = str(autosampler_id).zfill(id_end - stx_end).encode()
         self.name = f"AutoSampler ID: {self.autosampler_id}" if name is None else name
         self.tray_type = tray_type
         self._syringe_volume = _syringe_volume_ if _syringe_volume_ else _syringe_volume
@@ -481,27 +585,16 @@ class KnauerAutosampler(FlowchemDevice):
         *args: int | str,
         **kwargs: str,
     ) -> str:
-        # input can be strings, is translated to enum internally -> enum no need to expose
-        # if value can't be translated to enum, just throw an error with the available options
-        command_class = command()
-        modus = modus.upper()
-
-        if modus == CommandModus.SET.name:
-            command_class.set_values(*args, **kwargs)
-            communication_string = command_class.return_setting_string()
-
-        elif modus == CommandModus.GET_PROGRAMMED.name:
-            communication_string = command_class.query_programmed()
-
-        elif modus == CommandModus.GET_ACTUAL.name:
-            communication_string = command_class.query_actual()
-
-        else:
-            raise CommandOrValueError(
-                f"You set {modus} as command modus, however modus should be {CommandModus.SET.name},"
-                f" {CommandModus.GET_ACTUAL.name}, {CommandModus.GET_PROGRAMMED.name} "
-            )
-        return f"{CommunicationFlags.MESSAGE_START.value.decode()}{self.autosampler_id}{ADDITIONAL_INFO}{communication_string}{CommunicationFlags.MESSAGE_END.value.decode()}"  # type: ignore
+        # Commands are rebuilt from a fresh instance each time, so identical requests give identical strings
+        kwargs_items = tuple(sorted(kwargs.items()))
+        return _communication_string(
+            command,  # type: ignore[arg-type]
+            modus.upper(),
+            self.autosampler_id,
+            args,
+            kwargs_items,
+            tuple(type(value) for value in (*args, *(v for _, v in kwargs_items))),
+        )
 
     @send_until_acknowledged(max_reaction_time=10)
     async def _set(self, message: str, idempotent: bool = True):
@@ -534,27 +627,18 @@ class KnauerAutosampler(FlowchemDevice):
 
     async def _parse_setting_reply(self, reply):
         # reply needs to be binary string
-
-        if reply == CommunicationFlags.ACKNOWLEDGE.value:  # type: ignore
-            return True
-        elif reply == CommunicationFlags.TRY_AGAIN.value:  # type: ignore
-            raise ASBusyError
-        elif reply == CommunicationFlags.NOT_ACKNOWLEDGE.value:  # type: ignore
-
-            raise CommandOrValueError
+        errors = _setting_reply_errors()
         # this is only the case with replies on queries
-        else:
+        if reply not in errors:
             raise ASError(
                 f"The reply is {reply} and does not fit the expected reply for value setting"
             )
+        if (error := errors[reply]) is not None:
+            raise error
+        return True
 
     async def _parse_query_reply(self, reply) -> int:
-        stx_end = ReplyStructure.STX_END.value  # type: ignore[name-defined]
-        etx_start = ReplyStructure.ETX_START.value  # type: ignore[name-defined]
-        id_end = ReplyStructure.ID_END.value  # type: ignore[name-defined]
-        ai_end = ReplyStructure.AI_END.value  # type: ignore[name-defined]
-        pfc_end = ReplyStructure.PFC_END.value  # type: ignore[name-defined]
-        value_end = ReplyStructure.VALUE_END.value  # type: ignore[name-defined]
+        stx_end, etx_start, *_ = _reply_offsets()
         reply_start_char, reply_stripped, reply_end_char = (
             reply[:stx_end],
             reply[stx_end:etx_start],
@@ -566,23 +650,16 @@ class KnauerAutosampler(FlowchemDevice):
         # basically, if the device gives an extended reply, length will be 14. This only matters for get commands
         if len(reply_stripped) == 14:
             # decompose further
-            as_id = reply[stx_end:id_end]
-            as_ai = reply[id_end:ai_end]
-            as_pfc = reply[ai_end:pfc_end]
-            as_val = reply[pfc_end:value_end]
+            as_id, as_ai, as_pfc, as_val = _reply_fields().unpack_from(reply)
             # check if reply from requested device
-            if int(as_id.decode()) != self.autosampler_id:
+            if as_id != self._id_bytes:
                 logger.error(f"AS_AI reply {as_ai} and AS_PFC reply {as_pfc}!")
                 raise ASError(
                     f"ID of used AS is {self.autosampler_id}, but ID in reply is {as_id}"
                 )
 
-            # if reply is only zeros, which can be, give back one 0 for interpretation
-            if len(as_val.decode().lstrip("0")) > 0:
-                return int(as_val.decode().lstrip("0"))
-            else:
-                return int(as_val.decode()[-1:])
-            # check the device ID against current device id
+            # int() parses the zero-padded value directly, an all-zeros reply gives 0
+            return int(as_val)
         else:
             raise ASError(
                 f"AutoSampler reply did not fit any of the known patterns, reply is: {reply_stripped}"
@@ -733,6 +810,12 @@ class KnauerAutosampler(FlowchemDevice):
             case _:
                 raise RuntimeError("Unknown valve type")
 
+    @staticmethod
+    def _ml_to_ul(volume: float) -> int:
+        """Convert a volume in mL to the nearest whole uL, the resolution of the built-in syringe."""
+        # Scale before rounding: int(round(1.001, 3) * 1000) truncates 1000.999... to 1000
+        return round(volume * 1000)
+
     async def aspirate(self, volume: float, flow_rate: float | int | None = None):
         """
         aspirate with built in syringe if no external syringe is set to AutoSampler.
@@ -748,7 +831,7 @@ class KnauerAutosampler(FlowchemDevice):
             raise NotImplementedError(
                 "Built in syringe does not allow to control flow rate"
             )
-        volume = int(round(volume, 3) * 1000)
+        volume = self._ml_to_ul(volume)
         command_string = await self._construct_communication_string(AspirateCommand, CommandModus.SET.name, volume)  # type: ignore
         # Non-idempotent: never auto-resend on a mid-transfer reset (double-aspirate).
         return await self._set(command_string, idempotent=False)
@@ -768,7 +851,7 @@ class KnauerAutosampler(FlowchemDevice):
             raise NotImplementedError(
                 "Built in syringe does not allow to control flow rate"
             )
-        volume = int(round(volume, 3) * 1000)
+        volume = self._ml_to_ul(volume)
         command_string = await self._construct_communication_string(DispenseCommand, CommandModus.SET.name, volume)  # type: ignore
         # Non-idempotent: never auto-resend on a mid-transfer reset (double-dispense).
         return await self._set(command_string, idempotent=False)
@@ -788,16 +871,16 @@ class KnauerAutosampler(FlowchemDevice):
 
     async def get_status(self):
         command_string = await self._construct_communication_string(RequestStatusCommand, CommandModus.GET_ACTUAL.name)  # type: ignore
-        reply = str(await self._query(command_string))
-        reply = (3 - len(reply)) * "0" + reply
+        code = await self._query(command_string)
         try:
-            return ASStatus(reply).name  # type: ignore
-        except ValueError:
+            return _status_names()[code]
+        except KeyError:
             # The AS returned a status code that is not in the ASStatus enum (there
             # are gaps in the documented codes). Returning the raw code instead of
             # raising keeps a single odd status poll from becoming a 500 that kills
             # the experiment thread. Callers compare against named states (e.g.
             # "NEEDLE_RUNNING"), so an unmapped code simply reads as "not that state".
+            reply = f"{code:03d}"
             logger.warning(
                 f"AS returned status code {reply!r} not in ASStatus enum; "
                 f"returning raw code instead of raising."
@@ -1,5 +1,6 @@
 """Auto-discover the device classes present in the device sub-folders and in the installed plugins."""
 
+import functools
 import inspect
 from importlib.metadata import entry_points
 from typing import Any
@@ -23,10 +24,13 @@ def is_device_class(test_object):
 
 def _autodiscover_devices_in_module(module) -> dict[str, Any]:
     """Given a module, autodiscover the device classes and return them as dict(name, object)."""
-    device_classes = inspect.getmembers(module, is_device_class)
-    logger.debug(f"Found {len(device_classes)} device type(s) in {module.__name__}")
+    # Scan the module namespace directly: inspect.getmembers() would getattr() and sort every name first.
     # Dict of device class names and their respective classes, i.e. {device_class_name: DeviceClass}.
-    return {obj_class[0]: obj_class[1] for obj_class in device_classes}
+    device_classes = {
+        name: obj for name, obj in vars(module).items() if is_device_class(obj)
+    }
+    logger.debug("Found {} device type(s) in {}", len(device_classes), module.__name__)
+    return device_classes
 
 
 def autodiscover_first_party() -> dict[str, Any]:
@@ -52,7 +56,15 @@ def autodiscover_device_classes() -> dict[str, Any]:
 
     First-party devices take priority over third-party ones on name collision.
     A warning is logged when a collision is detected so the overriding is explicit.
+
+    The discovery only runs once per process, callers get a copy of the cached mapping.
     """
+    return dict(_discover_device_classes())
+
+
+@functools.cache
+def _discover_device_classes() -> dict[str, Any]:
+    """Walk first- and third-party device modules (cached by `autodiscover_device_classes`)."""
     first = autodiscover_first_party()
     third = autodiscover_third_party()
 
@@ -150,7 +150,8 @@ def parse_device(dev_settings: dict, device_object_mapper: dict) -> FlowchemDevi
 
         raise ConnectionError(msg) from error
 
-    logger.debug(f"Created '{device.name}' instance: {device.__class__.__name__}")
+    # Lazy loguru formatting: the message is only built if a DEBUG sink is active.
+    logger.debug("Created '{}' instance: {}", device.name, type(device).__name__)
     return device
 
 
@@ -52,7 +52,9 @@ ACK = chr(6)  # 0x06 — acknowledge
 NAK = chr(21)  # 0x15 — negative acknowledge
 
 # Reverse map: address letter → pump number (e.g. 'a' → 1)
-ADDRESS_TO_NUM: dict[str, int] = {v: k for k, v in PUMP_ADDRESS.items()}
+ADDRESS_TO_NUM: dict[str, int] = {
+    address: num for num, address in enumerate(PUMP_ADDRESS) if address
+}
 
 
 def _ack(payload: str = "") -> str:
@@ -146,7 +148,7 @@ class SimulatedHamiltonPumpIO(HamiltonPumpIO):
             raise InvalidConfigurationError("No simulated pump found in daisy chain.")
 
         last_pump = 0
-        for pump_num, address in PUMP_ADDRESS.items():
+        for pump_num, address in enumerate(PUMP_ADDRESS[1:], start=1):
             await self._write_async(f"{address}UR\r".encode("ascii"))
             if (await self._read_reply_async()).strip():
                 last_pump = pump_num
@@ -232,10 +234,9 @@ class SimulatedHamiltonPumpIO(HamiltonPumpIO):
             if not isinstance(command, list):
                 command = [command]
 
-            command_compiled = ""
-            for com in command:
-                command_compiled += com._multiple_compile()
-            full_compiled = com.multiple_compile(command_compiled)
+            full_compiled = command[0].multiple_compile(
+                "".join(com._multiple_compile() for com in command)
+            )
             logger.debug(
                 f"[SIM] multiple_write_and_read_reply_async: {full_compiled!r}"
             )
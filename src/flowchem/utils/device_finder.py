@@ -1,5 +1,6 @@
 """Autodiscover any supported devices connected to the PC."""
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import aioserial
@@ -24,34 +25,39 @@ SERIAL_DEVICE_INSPECTORS = (
 )
 
 
+def _inspect_serial_port(serial_port: str) -> set[str]:
+    """Try all the serial inspectors on a port, return the config of the first device found."""
+    logger.info(f"Looking for known devices on {serial_port}...")
+    # Check if the serial port is available (i.e. not already open)
+    try:
+        port = aioserial.Serial(serial_port)
+        port.close()
+    except OSError:
+        logger.info(f"Skipping {serial_port} (cannot be opened: already in use?)")
+        return set()
+
+    # For each port try all functions that can detect serial port devices
+    for inspector in SERIAL_DEVICE_INSPECTORS:
+        # a list of config is return by the inspector, if len(config) == 0 then it is falsy
+        if config := inspector(serial_port):
+            return config
+    logger.info(f"No known device found on {serial_port}")
+    return set()
+
+
 def inspect_serial_ports() -> set[str]:
     """Search for known devices on local serial ports and generate config stubs."""
     port_available = [comport.device for comport in list_ports.comports()]
     logger.info(
         f"Found the following serial port(s) on the current device: {port_available}",
     )
+    if not port_available:
+        return set()
 
-    dev_found_config: set[str] = set()
-    # Loop each serial port
-    for serial_port in port_available:
-        logger.info(f"Looking for known devices on {serial_port}...")
-        # Check if the serial port is available (i.e. not already open)
-        try:
-            port = aioserial.Serial(serial_port)
-            port.close()
-        except OSError:
-            logger.info(f"Skipping {serial_port} (cannot be opened: already in use?)")
-            continue
-
-        # For each port try all functions that can detect serial port devices
-        for inspector in SERIAL_DEVICE_INSPECTORS:
-            # a list of config is return by the inspector, if len(config) == 0 then it is falsy
-            if config := inspector(serial_port):
-                dev_found_config.update(config)
-                break
-        logger.info(f"No known device found on {serial_port}")
-
-    return dev_found_config
+    # Ports are independent and probing is I/O bound (mostly waiting for timeouts), so scan them all at once.
+    with ThreadPoolExecutor(max_workers=len(port_available)) as executor:
+        configs = executor.map(_inspect_serial_port, port_available)
+        return set().union(*configs)
 
 
 def inspect_eth(source_ip: str) -> set[str]:
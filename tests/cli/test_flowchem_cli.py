@@ -1,5 +1,7 @@
+import asyncio
 from pathlib import Path
 from textwrap import dedent
+from types import SimpleNamespace
 
 from click.testing import CliRunner
 
@@ -43,3 +45,27 @@ def test_cli(mocker):
         assert result.exit_code == 0
         assert Path("logfile.log").exists()
         assert "Starting server" in Path("logfile.log").read_text()
+
+
+def test_cli_uvloop(mocker):
+    runner = CliRunner()
+    mocker.patch("uvicorn.Server", return_value=FakeServer)
+    mocker.patch("flowchem.__main__.HAS_UVLOOP", True)
+
+    # uvloop >= 0.18 provides run(), older versions only install()
+    new_uvloop = SimpleNamespace(run=mocker.Mock(side_effect=asyncio.run))
+    old_uvloop = SimpleNamespace(install=mocker.Mock())
+
+    with runner.isolated_filesystem():
+        with open("test_configuration.toml", "w") as f:
+            f.write('[device.test-device]\ntype = "FakeDevice"\n')
+
+        for fake_uvloop, entry_point in (
+            (new_uvloop, new_uvloop.run),
+            (old_uvloop, old_uvloop.install),
+        ):
+            mocker.patch("flowchem.__main__.uvloop", fake_uvloop, create=True)
+            # noinspection PyTypeChecker
+            result = runner.invoke(main, ["test_configuration.toml"])
+            assert result.exit_code == 0, result.output
+            entry_point.assert_called_once()
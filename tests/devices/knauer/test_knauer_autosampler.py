@@ -0,0 +1,191 @@
+"""Knauer autosampler helpers that do not need the NDA_knauer_AS command package."""
+
+import asyncio
+from enum import Enum
+from types import SimpleNamespace
+
+import pytest
+
+from flowchem.devices.knauer import knauer_autosampler
+from flowchem.devices.knauer.knauer_autosampler import (
+    ASBusyError,
+    ASError,
+    ASEthernetDevice,
+    KnauerAutosampler,
+    send_until_acknowledged,
+)
+
+
+class FakeCommunicationFlags(Enum):
+    """Stand-in for NDA_knauer_AS CommunicationFlags."""
+
+    MESSAGE_START = b"\x02"
+    MESSAGE_END = b"\x03"
+    ACKNOWLEDGE = b"\x06"
+    NOT_ACKNOWLEDGE = b"\x15"
+    TRY_AGAIN = b"\x13"
+
+
+@pytest.fixture
+def flags(monkeypatch):
+    monkeypatch.setattr(
+        knauer_autosampler,
+        "CommunicationFlags",
+        FakeCommunicationFlags,
+        raising=False,
+    )
+    knauer_autosampler._communication_flag_values.cache_clear()
+    yield FakeCommunicationFlags
+    knauer_autosampler._communication_flag_values.cache_clear()
+
+
+async def serve_chunks(chunks: list[bytes]):
+    """Local AS stand-in: reply to each connection with `chunks`, written one at a time."""
+    state = {"received": []}
+
+    async def handle(reader, writer):
+        state["received"].append(await reader.read(1024))
+        for chunk in chunks:
+            writer.write(chunk)
+            await writer.drain()
+            await asyncio.sleep(0.01)
+        writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    return server, server.sockets[0].getsockname()[1], state
+
+
+@pytest.mark.parametrize(
+    "volume_ml, volume_ul",
+    [(0.0, 0), (0.001, 1), (0.029, 29), (1.001, 1001), (1.009, 1009), (2.5, 2500)],
+)
+def test_ml_to_ul(volume_ml, volume_ul):
+    assert KnauerAutosampler._ml_to_ul(volume_ml) == volume_ul
+
+
+def test_ml_to_ul_every_microliter():
+    # The previous int(round(v, 3) * 1000) was off by one for 24 of these
+    for volume_ul in range(1, 2501):
+        assert KnauerAutosampler._ml_to_ul(volume_ul / 1000) == volume_ul
+
+
+def busy_for(tries: int):
+    """Fake send coroutine answering TRY_AGAIN (ASBusyError) for the first `tries` calls."""
+    calls = []
+
+    async def send(message):
+        calls.append(message)
+        if len(calls) <= tries:
+            raise ASBusyError
+        return True
+
+    return send, calls
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake monotonic clock for send_until_acknowledged, advanced only by its (recorded) sleeps."""
+    state = SimpleNamespace(now=0.0, sleeps=[])
+
+    async def sleep(delay):
+        state.sleeps.append(delay)
+        state.now = round(state.now + delay, 9)
+
+    monkeypatch.setattr(knauer_autosampler, "asyncio", SimpleNamespace(sleep=sleep))
+    monkeypatch.setattr(
+        knauer_autosampler, "time", SimpleNamespace(monotonic=lambda: state.now)
+    )
+    return state
+
+
+async def test_busy_retried_until_acknowledged(clock):
+    send, calls = busy_for(3)
+    assert await send_until_acknowledged(max_reaction_time=1)(send)("cmd") is True
+    assert len(calls) == 4
+    assert clock.sleeps == [0.005, 0.01, 0.02]
+
+
+async def test_busy_raises_after_max_reaction_time(clock):
+    send, calls = busy_for(1000)
+    with pytest.raises(ASError, match=r"\(9 retries while busy\)"):
+        await send_until_acknowledged(max_reaction_time=0.5)(send)("cmd")
+    # Doubling backoff capped at 100 ms, the last sleep cut short to end on the deadline
+    assert clock.sleeps == pytest.approx(
+        [0.005, 0.01, 0.02, 0.04, 0.08, 0.1, 0.1, 0.1, 0.045]
+    )
+    assert clock.now == 0.5
+    assert len(calls) == 10
+
+
+async def test_exchange_reassembles_split_reply(flags):
+    server, port, state = await serve_chunks([b"\x02611", b"00PFC1", b"000042\x03"])
+    async with server:
+        device = ASEthernetDevice("127.0.0.1", tcp_port=port)
+        reply = await device._send_and_receive("\x0261query\x03")
+    assert reply == b"\x0261100PFC1000042\x03"
+    assert state["received"] == [b"\x0261query\x03"]
+
+
+async def test_exchange_returns_bare_flag(flags):
+    server, port, _ = await serve_chunks([flags.ACKNOWLEDGE.value])
+    async with server:
+        device = ASEthernetDevice("127.0.0.1", tcp_port=port)
+        assert await device._send_and_receive("set") == b"\x06"
+
+
+async def test_exchanges_are_serialized(flags, monkeypatch):
+    server, port, _ = await serve_chunks([b"\x02", b"61", b"\x03"])
+    device = ASEthernetDevice("127.0.0.1", tcp_port=port)
+    exchange, active, max_active = device._exchange, [0], [0]
+
+    async def counting_exchange(message, idempotent):
+        active[0] += 1
+        max_active[0] = max(max_active[0], active[0])
+        try:
+            return await exchange(message, idempotent)
+        finally:
+            active[0] -= 1
+
+    monkeypatch.setattr(device, "_exchange", counting_exchange)
+    async with server:
+        replies = await asyncio.gather(
+            *(device._send_and_receive(f"cmd{i}") for i in range(3))
+        )
+    # A lone MESSAGE_START chunk does not end the reply
+    assert replies == [b"\x0261\x03"] * 3
+    assert max_active[0] == 1
+
+
+async def test_exchange_incomplete_reply_is_retried(flags, monkeypatch):
+    monkeypatch.setattr(ASEthernetDevice, "COMMAND_RETRIES", 2)
+    monkeypatch.setattr(ASEthernetDevice, "COMMAND_RETRY_DELAY", 0)
+    server, port, state = await serve_chunks([b"\x0261"])
+    async with server:
+        device = ASEthernetDevice("127.0.0.1", tcp_port=port)
+        with pytest.raises(ConnectionError, match="after 2 attempts"):
+            await device._send_and_receive("query")
+    assert len(state["received"]) == 2
+
+
+class EchoCommand:
+    """Stand-in command class whose setting string echoes its values."""
+
+    def set_values(self, *args, **kwargs):
+        self.values = (*args, *kwargs.values())
+
+    def return_setting_string(self):
+        return "SET" + ",".join(map(str, self.values))
+
+
+async def test_command_string_cache_distinguishes_equal_values(flags, monkeypatch):
+    monkeypatch.setattr(knauer_autosampler, "ADDITIONAL_INFO", "", raising=False)
+    knauer_autosampler._communication_string.cache_clear()
+    autosampler = object.__new__(KnauerAutosampler)
+    autosampler.autosampler_id = 61
+
+    strings = [
+        await autosampler._construct_communication_string(EchoCommand, "set", value)
+        for value in (True, 1, 1.0)
+    ]
+    assert strings == ["\x0261SETTrue\x03", "\x0261SET1\x03", "\x0261SET1.0\x03"]
+    knauer_autosampler._communication_string.cache_clear()
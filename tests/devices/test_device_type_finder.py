@@ -11,3 +11,10 @@ def test_device_finder():
 
     assert "HeiConnect" in dev_found
     assert "SimulatedHeiConnect" in dev_found
+
+
+def test_device_finder_returns_independent_copies():
+    first = autodiscover_device_classes()
+    first.pop("HeiConnect")
+
+    assert "HeiConnect" in autodiscover_device_classes()
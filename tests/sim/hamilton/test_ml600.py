@@ -83,6 +83,45 @@ class TestInitialization:
         """ML600.dual_syringe should be False for a single-syringe sim."""
         assert ml600_single.dual_syringe is False
 
+    async def test_hardware_probes_cached(self, ml600_single, monkeypatch):
+        """Syringe type and firmware version should reuse the answers from initialize()."""
+
+        async def no_io(command):
+            raise AssertionError("unexpected serial transaction")
+
+        monkeypatch.setattr(ml600_single, "send_command_and_read_reply", no_io)
+        assert await ml600_single.is_single_syringe() is True
+        assert await ml600_single.version() == "NV01.02.3"
+
+    async def test_multiple_commands_use_pump_address(self, ml600_single, monkeypatch):
+        """Batched commands should be retargeted to the pump address, not left at pump 1."""
+        from flowchem.devices.hamilton.ml600 import ML600Commands, Protocol1Command
+
+        sent = []
+
+        async def capture(commands):
+            sent.extend(commands)
+            return ""
+
+        monkeypatch.setattr(
+            ml600_single.pump_io, "multiple_write_and_read_reply_async", capture
+        )
+        ml600_single.address = 2
+        batch = [
+            Protocol1Command(
+                command=ML600Commands.VALVE_BY_ANGLE_CW, command_value="90"
+            ),
+            Protocol1Command(command=ML600Commands.ABSOLUTE_MOVE, command_value="1000"),
+        ]
+        await ml600_single.send_multiple_commands(batch)
+
+        assert [com.target_pump_num for com in sent] == [2, 2]
+        assert [com.target_pump_num for com in batch] == [1, 1]  # originals untouched
+        compiled = sent[0].multiple_compile(
+            "".join(com._multiple_compile() for com in sent)
+        )
+        assert compiled.startswith("b")
+
     async def test_pump_component_name_single(self, ml600_single):
         """Single-syringe pump component should be named 'pump'."""
         assert ml600_single.components[0].name == "pump"
@@ -359,6 +398,34 @@ class TestCommandCompilation:
         )
         assert cmd.compile().startswith("b")
 
+    def test_compile_is_cached(self):
+        """Compiling an identical command twice should hit the compile cache."""
+        from flowchem.devices.hamilton.ml600 import (
+            ML600Commands,
+            Protocol1Command,
+            _compile_command,
+        )
+
+        cmd = Protocol1Command(
+            command=ML600Commands.REQUEST_DONE,
+            execution_command="",
+            target_pump_num=3,
+        )
+        first = cmd.compile()
+        hits = _compile_command.cache_info().hits
+        assert cmd.compile() == first == "cF"
+        assert _compile_command.cache_info().hits == hits + 1
+
+    def test_command_is_immutable(self):
+        """Protocol1Command is frozen, so shared command instances cannot be retargeted."""
+        from dataclasses import FrozenInstanceError
+
+        from flowchem.devices.hamilton.ml600 import ML600Commands, Protocol1Command
+
+        cmd = Protocol1Command(command=ML600Commands.REQUEST_DONE)
+        with pytest.raises(FrozenInstanceError):
+            cmd.target_pump_num = 2
+
     def test_multiple_compile_produces_correct_prefix(self):
         """multiple_compile should prepend the pump address letter."""
         from flowchem.devices.hamilton.ml600 import Protocol1Command, ML600Commands
@@ -509,3 +576,137 @@ class TestSimulatedIO:
         io._state[1].return_steps = 48
         response = io._dispatch("aYQNR\r", pump_num=1)
         assert "48" in response
+
+
+# ---------------------------------------------------------------------------
+# Group 6 — Real HamiltonPumpIO address assignment over a fake serial port
+# ---------------------------------------------------------------------------
+
+
+class _FakeSerial:
+    """Minimal aioserial stand-in replying to '1a' and '{address}UR' for a chain of pumps."""
+
+    port = "FAKE"
+
+    def __init__(self, num_pumps: int, last_address_hint: str) -> None:
+        self.num_pumps = num_pumps
+        self.hint = last_address_hint
+        self.written: list[bytes] = []
+        self._replies: list[bytes] = []
+
+    async def write_async(self, command: bytes) -> None:
+        self.written.append(command)
+        if command == b"1a\r":
+            self._replies.append(f"1{self.hint}\r".encode("ascii"))
+        else:
+            pump_num = ord(command[:1]) - ord("a") + 1
+            present = pump_num <= self.num_pumps
+            self._replies.append(b"NV01.02.3\r" if present else b"\r")
+
+    async def read_until_async(self, expected: bytes = b"\n") -> bytes:
+        return self._replies.pop(0) if self._replies else b""
+
+    def reset_input_buffer(self) -> None:
+        self._replies.clear()
+
+
+class TestAddressAssignment:
+
+    async def test_valid_hint_skips_enumeration(self):
+        """A correct last-address hint is confirmed with two probes only."""
+        from flowchem.devices.hamilton.ml600 import HamiltonPumpIO
+
+        serial = _FakeSerial(num_pumps=3, last_address_hint="c")
+        assert await HamiltonPumpIO(serial)._assign_pump_address() == 3
+        assert serial.written[2:] == [b"cUR\r", b"dUR\r"]
+
+    async def test_wrong_hint_falls_back_to_enumeration(self):
+        """An unreliable hint (too low) must not under-report the chain length."""
+        from flowchem.devices.hamilton.ml600 import HamiltonPumpIO
+
+        serial = _FakeSerial(num_pumps=3, last_address_hint="b")
+        assert await HamiltonPumpIO(serial)._assign_pump_address() == 3
+
+    async def test_invalid_hint_falls_back_to_enumeration(self):
+        """A non-address hint character triggers the explicit enumeration."""
+        from flowchem.devices.hamilton.ml600 import HamiltonPumpIO
+
+        serial = _FakeSerial(num_pumps=2, last_address_hint="N")
+        assert await HamiltonPumpIO(serial)._assign_pump_address() == 2
+
+    async def test_stale_first_reply_discarded(self):
+        """Leftovers of a wrong first '1a' reply are not read as the second reply."""
+        from flowchem.devices.hamilton.ml600 import HamiltonPumpIO
+
+        class _GarbledSerial(_FakeSerial):
+            async def write_async(self, command: bytes) -> None:
+                if not self.written:
+                    self.written.append(command)
+                    self._replies += [b"\r", b"garbage\r"]
+                else:
+                    await super().write_async(command)
+
+        serial = _GarbledSerial(num_pumps=2, last_address_hint="b")
+        assert await HamiltonPumpIO(serial)._assign_pump_address() == 2
+
+    async def test_write_timeout_retried_once(self):
+        """A single write timeout is recovered by resending the command."""
+        import aioserial
+
+        from flowchem.devices.hamilton.ml600 import HamiltonPumpIO
+
+        class _StallingSerial(_FakeSerial):
+            stalled = False
+
+            def reset_output_buffer(self) -> None:
+                pass
+
+            async def write_async(self, command: bytes) -> None:
+                if not self.stalled:
+                    self.stalled = True
+                    raise aioserial.SerialTimeoutException("Write timeout")
+                await super().write_async(command)
+
+        serial = _StallingSerial(num_pumps=1, last_address_hint="a")
+        await HamiltonPumpIO(serial)._write_async(b"aUR\r")
+        assert serial.written == [b"aUR\r"]
+
+
+# ---------------------------------------------------------------------------
+# Group 7 — Device finder output
+# ---------------------------------------------------------------------------
+
+
+class TestFinder:
+
+    def test_finder_output_is_valid_toml(self, monkeypatch):
+        """The config snippets generated by ml600_finder should parse as TOML."""
+        from types import SimpleNamespace
+
+        from flowchem.devices.hamilton import ml600_finder
+
+        try:
+            import tomllib
+        except ImportError:
+            import tomli as tomllib
+
+        async def initialize(hw_initialization):
+            pass
+
+        link = SimpleNamespace(
+            initialize=initialize,
+            num_pump_connected=2,
+            _serial=SimpleNamespace(close=lambda: None),
+        )
+        monkeypatch.setattr(
+            ml600_finder.HamiltonPumpIO, "from_config", lambda config: link
+        )
+
+        snippets = ml600_finder.ml600_finder("COM7")
+        devices = tomllib.loads("".join(snippets))["device"]
+
+        assert len(devices) == 2
+        assert sorted(dev["address"] for dev in devices.values()) == [1, 2]
+        for dev in devices.values():
+            assert dev["type"] == "ML600"
+            assert dev["port"] == "COM7"
@@ -1,5 +1,7 @@
 """Tests for HuberChillerSim."""
 
+import asyncio
+
 import pytest
 from flowchem.sim.devices.huber.huber_sim import HuberChillerSim
 
@@ -92,3 +94,163 @@ class TestHuberChillerSim:
         t_min, t_max = await device.temperature_limits()
         assert t_min == -80.0
         assert t_max == 80.0
+
+
+# ---------------------------------------------------------------------------
+# Status word decoding (pure unit tests, no device needed)
+# ---------------------------------------------------------------------------
+
+STATUS1_FLAGS = (
+    "temp_ctl_is_process",
+    "circulation_active",
+    "refrigerator_on",
+    "temp_is_process",
+    "circulating_pump",
+    "cooling_power_available",
+    "tkeylock",
+    "is_pid_auto",
+    "error",
+    "warning",
+    "int_temp_mode",
+    "ext_temp_mode",
+    "dv_e_grade",
+    "power_failure",
+    "freeze_protection",
+)
+STATUS2_FLAGS = (
+    "controller_is_external",
+    "drip_tray_full",
+    "venting_active",
+    "venting_successful",
+    "venting_monitored",
+)
+
+
+def reply(data: str):
+    from flowchem.devices.huber.pb_command import PBCommand
+
+    return PBCommand(f"{{S0A{data}\r\n")
+
+
+def flags_set(all_flags, *true_flags) -> dict[str, bool]:
+    return {flag: flag in true_flags for flag in all_flags}
+
+
+class TestStatusDecoding:
+
+    @pytest.mark.parametrize(
+        "data, bits",
+        [
+            ("0000", [False] * 16),
+            ("FFFF", [True] * 16),
+            ("8001", [True] + [False] * 14 + [True]),
+            ("A5A5", [True, False, True, False, False, True, False, True] * 2),
+        ],
+    )
+    def test_parse_bits_msb_first(self, data, bits):
+        assert reply(data).parse_bits() == bits
+
+    @pytest.mark.parametrize(
+        "data, true_flags",
+        [
+            ("0000", ()),
+            ("0001", ()),  # bit 0 is not used
+            ("FFFF", STATUS1_FLAGS),
+            ("8000", ("temp_ctl_is_process",)),
+            ("0080", ("error",)),
+            ("0040", ("warning",)),
+            ("0002", ("freeze_protection",)),
+            (
+                "6900",
+                (
+                    "circulation_active",
+                    "refrigerator_on",
+                    "circulating_pump",
+                    "is_pid_auto",
+                ),
+            ),
+        ],
+    )
+    def test_parse_status1(self, data, true_flags):
+        assert reply(data).parse_status1() == flags_set(STATUS1_FLAGS, *true_flags)
+
+    @pytest.mark.parametrize(
+        "data, true_flags",
+        [
+            ("0000", ()),
+            ("7A3F", ()),  # only unused bits set
+            ("FFFF", STATUS2_FLAGS),
+            ("8000", ("controller_is_external",)),
+            ("0400", ("drip_tray_full",)),
+            ("01C0", ("venting_active", "venting_successful", "venting_monitored")),
+        ],
+    )
+    def test_parse_status2(self, data, true_flags):
+        assert reply(data).parse_status2() == flags_set(STATUS2_FLAGS, *true_flags)
+
+
+# ---------------------------------------------------------------------------
+# Real HuberChiller serial exchange over a fake aioserial
+# (HuberChillerSim overrides _send_command_and_read_reply)
+# ---------------------------------------------------------------------------
+
+
+class FakeAioSerial:
+    """Minimal aioserial stand-in replying to each PB command from `replies`."""
+
+    def __init__(self, replies: dict[bytes, bytes]) -> None:
+        self.replies = replies
+        self.written: list[bytes] = []
+        self.buffer = bytearray()
+
+    def reset_input_buffer(self) -> None:
+        self.buffer.clear()
+
+    async def write_async(self, data: bytes) -> None:
+        self.written.append(data)
+        # The reply trickles in one byte at a time
+        for byte in self.replies[data]:
+            await asyncio.sleep(0)
+            self.buffer.append(byte)
+
+    async def read_async(self, size: int = 1) -> bytes:
+        await asyncio.sleep(0)
+        data = bytes(self.buffer[:size])
+        del self.buffer[:size]
+        return data
+
+
+def real_chiller(replies: dict[bytes, bytes]):
+    from flowchem.devices.huber.chiller import HuberChiller
+
+    serial = FakeAioSerial(replies)
+    return HuberChiller(serial, name="test-huber"), serial
+
+
+class TestSendCommandAndReadReply:
+
+    async def test_normal_reply(self):
+        chiller, serial = real_chiller({b"{M00****\r\n": b"{S000A28\r\n"})
+        assert await chiller._send_command_and_read_reply("{M00****") == "{S000A28\r\n"
+        assert serial.written == [b"{M00****\r\n"]
+
+    async def test_short_reply_returned_as_is(self):
+        chiller, _ = real_chiller({b"{M00****\r\n": b"{S00\r\n"})
+        assert await chiller._send_command_and_read_reply("{M00****") == "{S00\r\n"
+
+    async def test_stale_input_discarded(self):
+        chiller, serial = real_chiller({b"{M01****\r\n": b"{S01FC18\r\n"})
+        # Late reply to an earlier command that timed out
+        serial.buffer += b"{S000A28\r\n"
+        assert await chiller._send_command_and_read_reply("{M01****") == "{S01FC18\r\n"
+
+    async def test_concurrent_callers_get_their_own_reply(self):
+        replies = {
+            f"{{M{address:02X}****\r\n".encode(): f"{{S{address:02X}{address:04X}\r\n".encode()
+            for address in range(8)
+        }
+        chiller, _ = real_chiller(replies)
+        results = await asyncio.gather(
+            *(chiller._send_command_and_read_reply(f"{{M{a:02X}****") for a in range(8))
+        )
+        assert [r.encode() for r in results] == list(replies.values())
@@ -37,6 +37,23 @@ class TestAzuraCompactSim:
 
         assert head == AzuraPumpHeads.FLOWRATE_TEN_ML
 
+    async def test_head_type_cached(self, azura):
+        from flowchem.devices.knauer.azura_compact import AzuraPumpHeads
+
+        await azura.set_headtype(AzuraPumpHeads.FLOWRATE_FIFTY_ML)
+        azura._sim_head = 10  # Not re-queried, the cached value is returned
+        assert await azura.get_headtype() == AzuraPumpHeads.FLOWRATE_FIFTY_ML
+        assert azura.max_allowed_flow == 50000
+
+    async def test_head_type_refused_keeps_cache(self, azura, monkeypatch):
+        from flowchem.devices.knauer.azura_compact import AzuraPumpHeads
+
+        monkeypatch.setattr(azura, "_handle_command", lambda message: "ERROR:2")
+        with pytest.warns(UserWarning, match="Setpoint refused"):
+            await azura.set_headtype(AzuraPumpHeads.FLOWRATE_FIFTY_ML)
+        assert await azura.get_headtype() == AzuraPumpHeads.FLOWRATE_TEN_ML
+        assert azura.max_allowed_flow == 10000
+
     async def test_set_and_get_flow_rate(self, azura):
         from flowchem import ureg
 